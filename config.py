@@ -8,126 +8,286 @@ Stores all configurable parameters including:
 - Timing intervals
 """
 
+import functools
+import importlib.util
 import os
-from dotenv import load_dotenv
+import py_compile
+import sys
 
-# Load environment variables from .env file
-load_dotenv()
+# .env file next to this module, and the Python module it is compiled into
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DOTENV_PATH = os.path.join(_BASE_DIR, '.env')
+_ENV_CACHE_PATH = os.path.join(_BASE_DIR, '_env_cache.py')
 
-class Config:
+# Environment variable names read by Config._load(), interned so lookups in
+# the interned snapshot below match by identity instead of comparing strings
+_K_ALPACA_API_KEY = sys.intern('ALPACA_API_KEY')
+_K_ALPACA_API_SECRET = sys.intern('ALPACA_API_SECRET')
+_K_ALPACA_BASE_URL = sys.intern('ALPACA_BASE_URL')
+_K_INITIAL_POT = sys.intern('INITIAL_POT')
+_K_PROFIT_TARGET = sys.intern('PROFIT_TARGET')
+_K_STOP_LOSS_PCT = sys.intern('STOP_LOSS_PCT')
+_K_TAKE_PROFIT_PCT = sys.intern('TAKE_PROFIT_PCT')
+_K_CHECK_INTERVAL = sys.intern('CHECK_INTERVAL')
+_K_TRADE_INTERVAL = sys.intern('TRADE_INTERVAL')
+_K_ASSET_CACHE_TTL = sys.intern('ASSET_CACHE_TTL')
+_K_MAX_CONSECUTIVE_LOSSES = sys.intern('MAX_CONSECUTIVE_LOSSES')
+_K_MIN_STOCK_PRICE = sys.intern('MIN_STOCK_PRICE')
+_K_MAX_STOCK_PRICE = sys.intern('MAX_STOCK_PRICE')
+_K_MAX_OPEN_POSITIONS = sys.intern('MAX_OPEN_POSITIONS')
+_K_LOG_FILE = sys.intern('LOG_FILE')
+_K_LOG_LEVEL = sys.intern('LOG_LEVEL')
+
+# Environment snapshot, populated on first use by _load_env()
+_ENV = {}
+_loaded = False
+
+def _read_env_cache(source):
     """
-    Configuration class for the trading bot.
-    All parameters can be modified here or via environment variables.
+    Return the values in _env_cache.py if it was generated from a .env file
+    with the given (mtime_ns, size), otherwise None.
     """
+    spec = importlib.util.spec_from_file_location('_env_cache', _ENV_CACHE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if getattr(module, 'SOURCE', None) != source:
+        return None
+    return module.ENV
+
+def _write_env_cache(source, values):
+    """
+    Write _env_cache.py and its .pyc for .env values read from source.
+    The .pyc is hash-checked against the .py, so a rewrite is never shadowed
+    by an older .pyc with the same whole-second mtime and size.
+    """
+    lines = [
+        "# Generated from .env by config.py - do not edit\n",
+        f"SOURCE = {source!r}\n",
+        "ENV = {\n",
+    ]
+    lines.extend(f"    {k!r}: {v!r},\n" for k, v in values.items())
+    lines.append("}\n")
     
-    # ============ API CREDENTIALS ============
-    # Get these from your Alpaca account: https://alpaca.markets/
-    # For paper trading (recommended for testing): https://paper-api.alpaca.markets
-    # For live trading: https://api.alpaca.markets
-    
-    API_KEY = os.getenv('ALPACA_API_KEY', 'YOUR_ALPACA_API_KEY_HERE')
-    API_SECRET = os.getenv('ALPACA_API_SECRET', 'YOUR_ALPACA_SECRET_KEY_HERE')
-    BASE_URL = os.getenv('ALPACA_BASE_URL', 'https://paper-api.alpaca.markets')  # Paper trading by default
-    
-    # ============ TRADING PARAMETERS ============
-    
-    # Initial capital to start trading with (in USD)
-    INITIAL_POT = float(os.getenv('INITIAL_POT', 1000.0))
-    
-    # Target profit before stopping the bot (in USD)
-    PROFIT_TARGET = float(os.getenv('PROFIT_TARGET', 500.0))
-    
-    # Stop loss percentage (0.10 = 10%)
-    STOP_LOSS_PCT = float(os.getenv('STOP_LOSS_PCT', 0.10))
-    
-    # Take profit percentage (0.10 = 10%)
-    TAKE_PROFIT_PCT = float(os.getenv('TAKE_PROFIT_PCT', 0.10))
-    
-    # ============ TIMING PARAMETERS ============
-    
-    # How often to check price for stop loss / take profit (in seconds)
-    CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', 30))  # Check every 30 seconds
-    
-    # Wait time between trades (in seconds)
-    TRADE_INTERVAL = int(os.getenv('TRADE_INTERVAL', 60))  # Wait 1 minute between trades
+    # The cache holds credentials, so only the owner may read it
+    # (the .pyc inherits this mode)
+    tmp_path = _ENV_CACHE_PATH + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        os.fchmod(f.fileno(), 0o600)
+        f.writelines(lines)
+    os.replace(tmp_path, _ENV_CACHE_PATH)
+    py_compile.compile(
+        _ENV_CACHE_PATH,
+        cfile=importlib.util.cache_from_source(_ENV_CACHE_PATH),
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH
+    )
+
+def _compile_env_cache():
+    """
+    Compile the .env file into _env_cache.py and return its values.
+    The cache records the mtime and size of the .env it was built from; the
+    .env file is only parsed when those differ, otherwise the values come
+    from the cached module's .pyc.
+    A .env that references other variables with ${VAR} is never cached, since
+    the expanded values would go stale when those variables change; it is
+    parsed and expanded on every load instead.
+    If the cache cannot be read or written (e.g. read-only install, or a cache
+    owned by another user) the parsed values are returned directly.
+    Returns an empty dict if there is no .env file.
+    """
+    try:
+        st = os.stat(_DOTENV_PATH)
+    except FileNotFoundError:
+        return {}
+    source = (st.st_mtime_ns, st.st_size)
     
-    # ============ RISK MANAGEMENT ============
+    try:
+        cached = _read_env_cache(source)
+    except (OSError, SyntaxError):
+        cached = None
+    if cached is not None:
+        return cached
     
-    # Maximum number of consecutive losses before pausing
-    MAX_CONSECUTIVE_LOSSES = int(os.getenv('MAX_CONSECUTIVE_LOSSES', 3))
+    from dotenv import dotenv_values
     
-    # Minimum stock price to consider (avoid penny stocks)
-    MIN_STOCK_PRICE = float(os.getenv('MIN_STOCK_PRICE', 5.0))
+    values = {k: v for k, v in dotenv_values(_DOTENV_PATH, interpolate=False).items() if v is not None}
+    if any('${' in v for v in values.values()):
+        return {k: v for k, v in dotenv_values(_DOTENV_PATH).items() if v is not None}
     
-    # Maximum stock price to consider (control position size)
-    MAX_STOCK_PRICE = float(os.getenv('MAX_STOCK_PRICE', 500.0))
+    try:
+        _write_env_cache(source, values)
+    except (OSError, py_compile.PyCompileError):
+        pass
+    return values
+
+def _load_env():
+    """
+    Load the .env file and snapshot the environment on first use.
+    Importing this module performs no file I/O.
+    """
+    global _ENV, _loaded
+    if not _loaded:
+        # Snapshot the environment once so lookups are plain dict hits
+        # instead of a round trip through the os.environ proxy per key.
+        # Real environment variables take precedence over .env values.
+        env = _compile_env_cache()
+        env.update(os.environ)
+        _ENV = {sys.intern(k): v for k, v in env.items()}
+        _loaded = True
+    return _ENV
+
+class Config:
+    """
+    Configuration class for the trading bot.
+    All parameters can be modified here or via environment variables.
+    Values are read from the environment on first instantiation.
+    """
     
-    # ============ LOGGING ============
+    # Set once the class-level values have been loaded and validated
+    _initialized = False
     
-    # Log file path
-    LOG_FILE = os.getenv('LOG_FILE', 'trading_bot.log')
+    # Validation rules checked in order by _validate_config(): (attribute, predicate, error message)
+    _RULES = (
+        ('API_KEY', lambda v: v != 'YOUR_ALPACA_API_KEY_HERE',
+         "Please set your Alpaca API key in config.py or as environment variable ALPACA_API_KEY"),
+        ('API_SECRET', lambda v: v != 'YOUR_ALPACA_SECRET_KEY_HERE',
+         "Please set your Alpaca API secret in config.py or as environment variable ALPACA_API_SECRET"),
+        ('INITIAL_POT', lambda v: v > 0, "Initial pot must be greater than 0"),
+        ('PROFIT_TARGET', lambda v: v > 0, "Profit target must be greater than 0"),
+        ('STOP_LOSS_PCT', lambda v: 0 < v < 1, "Stop loss percentage must be between 0 and 1"),
+        ('TAKE_PROFIT_PCT', lambda v: 0 < v < 1, "Take profit percentage must be between 0 and 1"),
+        ('CHECK_INTERVAL', lambda v: v > 0, "Check interval must be greater than 0"),
+        ('MAX_OPEN_POSITIONS', lambda v: v > 0, "Max open positions must be greater than 0"),
+    )
     
-    # Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    # Output of display(), filled from the class-level parameters
+    _DISPLAY_TEMPLATE = (
+        "\n" + "="*60 + "\n"
+        "TRADING BOT CONFIGURATION\n"
+        + "="*60 + "\n"
+        "Base URL: {BASE_URL}\n"
+        "Initial Pot: ${INITIAL_POT:.2f}\n"
+        "Profit Target: ${PROFIT_TARGET:.2f}\n"
+        "Stop Loss: {STOP_LOSS_PCT:.1%}\n"
+        "Take Profit: {TAKE_PROFIT_PCT:.1%}\n"
+        "Check Interval: {CHECK_INTERVAL}s\n"
+        "Trade Interval: {TRADE_INTERVAL}s\n"
+        "Max Consecutive Losses: {MAX_CONSECUTIVE_LOSSES}\n"
+        "Stock Price Range: ${MIN_STOCK_PRICE:.2f} - ${MAX_STOCK_PRICE:.2f}\n"
+        + "="*60 + "\n"
+    )
     
     def __init__(self):
         """
-        Initialize and validate configuration.
+        Initialize configuration.
+        The class-level parameters are loaded and validated once, on the first
+        instantiation per process; later instantiations do no work.
         """
-        self.validate()
+        if not Config._initialized:
+            Config._load(_load_env())
+            _validate_config(Config)
+            Config._initialized = True
     
-    def validate(self):
+    @classmethod
+    def _load(cls, env):
         """
-        Validate configuration parameters.
-        Raises ValueError if any parameter is invalid.
+        Populate the class-level parameters from an environment mapping.
         """
-        if self.API_KEY == 'YOUR_ALPACA_API_KEY_HERE':
-            raise ValueError(
-                "Please set your Alpaca API key in config.py or as environment variable ALPACA_API_KEY"
-            )
+        # ============ API CREDENTIALS ============
+        # Get these from your Alpaca account: https://alpaca.markets/
+        # For paper trading (recommended for testing): https://paper-api.alpaca.markets
+        # For live trading: https://api.alpaca.markets
+        
+        cls.API_KEY = env.get(_K_ALPACA_API_KEY, 'YOUR_ALPACA_API_KEY_HERE')
+        cls.API_SECRET = env.get(_K_ALPACA_API_SECRET, 'YOUR_ALPACA_SECRET_KEY_HERE')
+        cls.BASE_URL = env.get(_K_ALPACA_BASE_URL, 'https://paper-api.alpaca.markets')  # Paper trading by default
+        
+        # ============ TRADING PARAMETERS ============
+        
+        # Initial capital to start trading with (in USD)
+        cls.INITIAL_POT = float(env.get(_K_INITIAL_POT, 1000.0))
+        
+        # Target profit before stopping the bot (in USD)
+        cls.PROFIT_TARGET = float(env.get(_K_PROFIT_TARGET, 500.0))
+        
+        # Stop loss percentage (0.10 = 10%)
+        cls.STOP_LOSS_PCT = float(env.get(_K_STOP_LOSS_PCT, 0.10))
+        
+        # Take profit percentage (0.10 = 10%)
+        cls.TAKE_PROFIT_PCT = float(env.get(_K_TAKE_PROFIT_PCT, 0.10))
+        
+        # Price multipliers for the stop loss and take profit levels
+        cls.STOP_MULT = 1 - cls.STOP_LOSS_PCT
+        cls.TP_MULT = 1 + cls.TAKE_PROFIT_PCT
+        
+        # ============ TIMING PARAMETERS ============
+        
+        # Minimum delay between REST checks for missed exit fills (in seconds);
+        # backs off to 10x while the price is far from both exit levels
+        cls.CHECK_INTERVAL = int(env.get(_K_CHECK_INTERVAL, 30))  # Check every 30 seconds
+        
+        # Wait time between trades (in seconds)
+        cls.TRADE_INTERVAL = int(env.get(_K_TRADE_INTERVAL, 60))  # Wait 1 minute between trades
         
-        if self.API_SECRET == 'YOUR_ALPACA_SECRET_KEY_HERE':
-            raise ValueError(
-                "Please set your Alpaca API secret in config.py or as environment variable ALPACA_API_SECRET"
-            )
+        # How long the list of tradable assets is reused before refreshing (in seconds)
+        cls.ASSET_CACHE_TTL = int(env.get(_K_ASSET_CACHE_TTL, 3600))  # Refresh hourly
         
-        if self.INITIAL_POT <= 0:
-            raise ValueError("Initial pot must be greater than 0")
+        # ============ RISK MANAGEMENT ============
         
-        if self.PROFIT_TARGET <= 0:
-            raise ValueError("Profit target must be greater than 0")
+        # Maximum number of consecutive losses before pausing
+        cls.MAX_CONSECUTIVE_LOSSES = int(env.get(_K_MAX_CONSECUTIVE_LOSSES, 3))
         
-        if not (0 < self.STOP_LOSS_PCT < 1):
-            raise ValueError("Stop loss percentage must be between 0 and 1")
+        # Minimum stock price to consider (avoid penny stocks)
+        cls.MIN_STOCK_PRICE = float(env.get(_K_MIN_STOCK_PRICE, 5.0))
         
-        if not (0 < self.TAKE_PROFIT_PCT < 1):
-            raise ValueError("Take profit percentage must be between 0 and 1")
+        # Maximum stock price to consider (control position size)
+        cls.MAX_STOCK_PRICE = float(env.get(_K_MAX_STOCK_PRICE, 500.0))
         
-        if self.CHECK_INTERVAL <= 0:
-            raise ValueError("Check interval must be greater than 0")
+        # Maximum number of positions held at the same time (pot is split between them)
+        cls.MAX_OPEN_POSITIONS = int(env.get(_K_MAX_OPEN_POSITIONS, 1))
+        
+        # ============ LOGGING ============
+        
+        # Log file path
+        cls.LOG_FILE = env.get(_K_LOG_FILE, 'trading_bot.log')
+        
+        # Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        cls.LOG_LEVEL = env.get(_K_LOG_LEVEL, 'INFO')
+    
+    def validate(self):
+        """
+        Validate configuration parameters.
+        Raises ValueError if any parameter is invalid.
+        """
+        _validate_config(self)
     
     def display(self):
         """
         Display current configuration (without sensitive data).
         """
-        print("\n" + "="*60)
-        print("TRADING BOT CONFIGURATION")
-        print("="*60)
-        print(f"Base URL: {self.BASE_URL}")
-        print(f"Initial Pot: ${self.INITIAL_POT:.2f}")
-        print(f"Profit Target: ${self.PROFIT_TARGET:.2f}")
-        print(f"Stop Loss: {self.STOP_LOSS_PCT*100}%")
-        print(f"Take Profit: {self.TAKE_PROFIT_PCT*100}%")
-        print(f"Check Interval: {self.CHECK_INTERVAL}s")
-        print(f"Trade Interval: {self.TRADE_INTERVAL}s")
-        print(f"Max Consecutive Losses: {self.MAX_CONSECUTIVE_LOSSES}")
-        print(f"Stock Price Range: ${self.MIN_STOCK_PRICE:.2f} - ${self.MAX_STOCK_PRICE:.2f}")
-        print("="*60 + "\n")
+        print(self._DISPLAY_TEMPLATE.format_map(vars(Config)))
+
+def _validate_config(obj):
+    """
+    Validate the parameters of a Config class or instance against its rules.
+    Raises ValueError if any parameter is invalid.
+    """
+    for name, is_valid, message in obj._RULES:
+        if not is_valid(getattr(obj, name)):
+            raise ValueError(message)
+
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """
+    Return the process-wide validated configuration instance.
+    """
+    return Config()
 
 if __name__ == "__main__":
     # Test configuration
     try:
-        config = Config()
+        config = get_config()
         config.display()
         print("✅ Configuration is valid!")
     except ValueError as e:
@@ -0,0 +1,69 @@
+"""
+Tests for the .env cache in config.py
+"""
+
+import os
+
+import pytest
+
+import config
+
+
+@pytest.fixture
+def env_paths(tmp_path, monkeypatch):
+    """
+    Point the .env file and its cache at a temporary directory.
+    """
+    dotenv_path = tmp_path / '.env'
+    monkeypatch.setattr(config, '_DOTENV_PATH', str(dotenv_path))
+    monkeypatch.setattr(config, '_ENV_CACHE_PATH', str(tmp_path / '_env_cache.py'))
+    return dotenv_path
+
+
+def test_rewrite_with_same_size_values_is_reloaded(env_paths):
+    env_paths.write_text("ALPACA_API_KEY=aaaa\nINITIAL_POT=1000\n")
+    assert config._compile_env_cache()['ALPACA_API_KEY'] == 'aaaa'
+    
+    env_paths.write_text("ALPACA_API_KEY=bbbb\nINITIAL_POT=5000\n")
+    env = config._compile_env_cache()
+    assert env['ALPACA_API_KEY'] == 'bbbb'
+    assert env['INITIAL_POT'] == '5000'
+
+
+def test_env_with_older_mtime_is_reloaded(env_paths):
+    env_paths.write_text("ALPACA_API_KEY=aaaa\n")
+    assert config._compile_env_cache()['ALPACA_API_KEY'] == 'aaaa'
+    
+    env_paths.write_text("ALPACA_API_KEY=bbbb\n")
+    os.utime(env_paths, (0, 0))
+    assert config._compile_env_cache()['ALPACA_API_KEY'] == 'bbbb'
+
+
+def test_unreadable_cache_falls_back_to_env(env_paths, monkeypatch):
+    env_paths.write_text("ALPACA_API_KEY=aaaa\n")
+    config._compile_env_cache()
+    
+    def deny(source):
+        raise PermissionError("cache owned by another user")
+    
+    monkeypatch.setattr(config, '_read_env_cache', deny)
+    assert config._compile_env_cache()['ALPACA_API_KEY'] == 'aaaa'
+
+
+def test_cache_is_private(env_paths):
+    env_paths.write_text("ALPACA_API_KEY=aaaa\n")
+    config._compile_env_cache()
+    assert os.stat(config._ENV_CACHE_PATH).st_mode & 0o777 == 0o600
+
+
+def test_validate_checks_instance_values(monkeypatch):
+    monkeypatch.setenv('ALPACA_API_KEY', 'key')
+    monkeypatch.setenv('ALPACA_API_SECRET', 'secret')
+    monkeypatch.setattr(config, '_DOTENV_PATH', '/nonexistent/.env')
+    monkeypatch.setattr(config, '_loaded', False)
+    monkeypatch.setattr(config.Config, '_initialized', False)
+    
+    c = config.Config()
+    c.STOP_LOSS_PCT = 2
+    with pytest.raises(ValueError, match="Stop loss percentage"):
+        c.validate()
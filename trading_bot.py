@@ -13,26 +13,67 @@ Author: Automated Trading System
 License: MIT
 """
 
-import alpaca_trade_api as tradeapi
+import asyncio
+import atexit
+import heapq
+import queue
 import time
 import logging
+import logging.handlers
+import threading
 from datetime import datetime
-from config import Config
+from config import get_config
 
-# Setup logging
+# Setup logging: records are queued and written by a background listener
+# thread so the trading loop never blocks on file or console I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('trading_bot.log', delay=True),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('trading_bot.log'),
-        logging.StreamHandler()
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Terminal statuses of an order that never filled
+_UNFILLED_EVENTS = ('canceled', 'rejected', 'expired')
+
 class TradingBot:
-    def __init__(self, config):
-        self.config = config
+    # Banners logged by run(), filled from the bot and its config
+    _START_BANNER = (
+        "\n" + "="*60 + "\n"
+        "TRADING BOT STARTED\n"
+        "Initial Pot: ${bot.pot:.2f}\n"
+        "Profit Target: ${config.PROFIT_TARGET:.2f}\n"
+        "Stop Loss: {config.STOP_LOSS_PCT:.1%}\n"
+        "Take Profit: {config.TAKE_PROFIT_PCT:.1%}\n"
+        + "="*60 + "\n"
+    )
+    _TARGET_BANNER = (
+        "\n" + "="*60 + "\n"
+        "🎉 PROFIT TARGET REACHED! 🎉\n"
+        "Total profit: ${bot.total_profit:.2f}\n"
+        "Final pot: ${bot.pot:.2f}\n"
+        "Trades completed: {bot.trades_completed}\n"
+        + "="*60 + "\n"
+    )
+    
+    # Seconds a REST price is reused by get_current_price()
+    _PRICE_CACHE_TTL = 0.5
+    
+    def __init__(self, config=None):
+        # Imported here so that importing this module stays cheap
+        import alpaca_trade_api as tradeapi
+        
+        self.config = config = config if config is not None else get_config()
         self.api = tradeapi.REST(
             config.API_KEY,
             config.API_SECRET,
@@ -43,60 +84,145 @@ class TradingBot:
         self.total_profit = 0.0
         self.trades_completed = 0
         
-        logger.info(f"Trading Bot initialized with pot: ${self.pot}")
-        logger.info(f"Target profit: ${config.PROFIT_TARGET}")
+        # Tradable asset symbols, served stale while a refresh runs in the background
+        self._assets_cache = None
+        self._assets_ts = 0.0
+        self._assets_refreshing = threading.Lock()
+        
+        # Order fill notifications, started by run()
+        self.stream = tradeapi.Stream(
+            config.API_KEY,
+            config.API_SECRET,
+            base_url=config.BASE_URL
+        )
+        self._stream_thread = None
+        self._loop = None
+        
+        # Open positions: exit fill futures by symbol, plus the number of
+        # position slots and capital in use (released together by the cycle)
+        self._exit_waiters = {}
+        self._open_positions = 0
+        self._committed = 0.0
+        
+        # Latest trade per held symbol, fed by the market data stream: (timestamp, price)
+        self._last_prices = {}
+        
+        # Recent REST prices by symbol: (timestamp, price)
+        self._price_cache = {}
+        
+        # Serializes stock selection and buying so concurrent cycles pick
+        # different symbols; created by _bind_loop() on the bot's event loop
+        self._open_lock = None
+        
+        logger.info("Trading Bot initialized with pot: $%s", self.pot)
+        logger.info("Target profit: $%s", config.PROFIT_TARGET)
+    
+    def _refresh_assets(self):
+        """
+        Fetch the active US equity list and cache the symbols of the assets
+        that are both tradable and shortable.
+        """
+        assets = self.api.list_assets(status='active', asset_class='us_equity')
+        
+        # Keep only the symbol column; the Asset objects are dropped here so
+        # later scans never go through their attribute lookups again
+        symbols = tuple(asset.symbol for asset in assets if asset.tradable and asset.shortable)
+        self._assets_cache = symbols
+        self._assets_ts = time.time()
+        return symbols
+    
+    def _refresh_assets_in_background(self):
+        """
+        Refresh the asset cache, keeping the stale list if the request fails.
+        """
+        try:
+            self._refresh_assets()
+        except Exception as e:
+            logger.warning("Error refreshing asset list, using cached list: %s", e)
+        finally:
+            self._assets_refreshing.release()
     
-    def get_most_traded_stock(self):
+    def get_tradable_symbols(self):
+        """
+        Get tradable and shortable active US stock symbols, cached for
+        ASSET_CACHE_TTL seconds.
+        An expired list is still returned while it is refreshed in the background.
+        """
+        if self._assets_cache is None:
+            return self._refresh_assets()
+        
+        if time.time() - self._assets_ts >= self.config.ASSET_CACHE_TTL:
+            if self._assets_refreshing.acquire(blocking=False):
+                threading.Thread(target=self._refresh_assets_in_background, daemon=True).start()
+        return self._assets_cache
+    
+    def get_most_traded_stock(self, exclude=()):
         """
         Find the most traded stock by volume in the US market.
+        Symbols in exclude (e.g. already held) are skipped.
         Returns the stock symbol.
         """
         try:
             logger.info("Searching for most traded stock...")
             
             # Get active US stocks
-            assets = self.api.list_assets(status='active', asset_class='us_equity')
-            
-            max_volume = 0
-            top_symbol = None
+            tradable = self.get_tradable_symbols()
             
             # Check top tradable stocks
-            for asset in assets[:100]:  # Check top 100 for efficiency
-                if not asset.tradable or not asset.shortable:
-                    continue
-                
-                try:
-                    # Get latest bar data
-                    barset = self.api.get_barset(asset.symbol, 'day', limit=1)
-                    if asset.symbol in barset:
-                        volume = barset[asset.symbol][0].v
-                        if volume > max_volume:
-                            max_volume = volume
-                            top_symbol = asset.symbol
-                except Exception as e:
-                    continue
+            symbols = [symbol for symbol in tradable if symbol not in exclude][:100]  # Check top 100 for efficiency
+            if not symbols:
+                return None
+            
+            # Fetch the current daily bar of every candidate in one request
+            snapshots = self.api.get_snapshots(symbols)
+            bars = {
+                symbol: snapshot.daily_bar
+                for symbol, snapshot in snapshots.items()
+                if snapshot is not None and snapshot.daily_bar is not None
+            }
+            if not bars:
+                return None
             
-            logger.info(f"Most traded stock: {top_symbol} with volume: {max_volume}")
+            top_symbol, top_bar = heapq.nlargest(1, bars.items(), key=lambda item: item[1].v)[0]
+            max_volume = top_bar.v
+            
+            logger.info("Most traded stock: %s with volume: %s", top_symbol, max_volume)
             return top_symbol
             
         except Exception as e:
-            logger.error(f"Error finding most traded stock: {e}")
+            logger.error("Error finding most traded stock: %s", e)
             return None
     
     def get_current_price(self, symbol):
         """
         Get the current market price for a symbol.
+        Held symbols are served from streamed trade prices received within
+        the last CHECK_INTERVAL seconds; otherwise this falls back to REST,
+        reusing a REST price for up to _PRICE_CACHE_TTL seconds.
         """
+        # A streamed price older than CHECK_INTERVAL means the data stream is
+        # down or reconnecting (or the symbol is no longer held), so use REST
+        streamed = self._last_prices.get(symbol)
+        if streamed is not None and time.time() - streamed[0] < self.config.CHECK_INTERVAL:
+            return streamed[1]
+        
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.time() - cached[0] < self._PRICE_CACHE_TTL:
+            return cached[1]
+        
         try:
             trade = self.api.get_latest_trade(symbol)
-            return float(trade.price)
+            price = float(trade.price)
+            self._price_cache[symbol] = (time.time(), price)
+            return price
         except Exception as e:
-            logger.error(f"Error getting price for {symbol}: {e}")
+            logger.error("Error getting price for %s: %s", symbol, e)
             return None
     
-    def place_buy_order(self, symbol, quantity):
+    def place_buy_order(self, symbol, quantity, stop_loss_price, take_profit_price):
         """
-        Place a market buy order.
+        Place a market buy order with attached stop loss and take profit legs.
+        The broker triggers the exit legs, so no price polling is needed.
         """
         try:
             order = self.api.submit_order(
@@ -104,175 +230,317 @@ class TradingBot:
                 qty=quantity,
                 side='buy',
                 type='market',
-                time_in_force='day'
+                time_in_force='gtc',
+                order_class='bracket',
+                stop_loss={'stop_price': round(stop_loss_price, 2)},
+                take_profit={'limit_price': round(take_profit_price, 2)}
             )
-            logger.info(f"Buy order placed: {quantity} shares of {symbol}")
+            logger.info("Buy order placed: %s shares of %s", quantity, symbol)
             return order
         except Exception as e:
-            logger.error(f"Error placing buy order: {e}")
+            logger.error("Error placing buy order: %s", e)
             return None
     
-    def place_sell_order(self, symbol, quantity):
+    async def _on_trade_update(self, data):
+        """
+        Handle a trade_updates event from the order stream.
+        Resolves the exit future of a held symbol with the raw order dict when
+        its exit leg fills, or when its buy order ends without filling.
+        Runs on the stream's own event loop thread.
         """
-        Place a market sell order.
+        order = data.order
+        if order['side'] == 'sell':
+            done = data.event == 'fill'
+        else:
+            done = data.event in _UNFILLED_EVENTS and not float(order.get('filled_qty') or 0)
+        
+        if done:
+            waiter = self._exit_waiters.get(order['symbol'])
+            if waiter is not None:
+                self._loop.call_soon_threadsafe(_resolve, waiter, order)
+    
+    async def _on_trade(self, trade):
+        """
+        Record the latest trade price of a held symbol from the data stream.
+        """
+        self._last_prices[trade.symbol] = (time.time(), float(trade.price))
+    
+    def _stream_trades(self, symbol, closed):
+        """
+        Stream trades for a held symbol until closed is set, so its price is
+        a dict lookup. Best effort: on failure prices keep coming from REST.
+        Runs in its own daemon thread because (un)subscribing blocks until the
+        stream loop has sent the request.
         """
         try:
-            order = self.api.submit_order(
-                symbol=symbol,
-                qty=quantity,
-                side='sell',
-                type='market',
-                time_in_force='day'
-            )
-            logger.info(f"Sell order placed: {quantity} shares of {symbol}")
-            return order
+            self.stream.subscribe_trades(self._on_trade, symbol)
         except Exception as e:
-            logger.error(f"Error placing sell order: {e}")
-            return None
+            logger.warning("Error subscribing to trades for %s, using REST prices: %s", symbol, e)
+        closed.wait()
+        self._unsubscribe_trades(symbol)
+    
+    def _unsubscribe_trades(self, symbol):
+        """
+        Stop streaming trades for a symbol and drop its cached price.
+        """
+        try:
+            self.stream.unsubscribe_trades(symbol)
+        except Exception as e:
+            logger.error("Error unsubscribing from trades for %s: %s", symbol, e)
+        self._last_prices.pop(symbol, None)
     
-    def monitor_position(self, symbol, entry_price, quantity, stop_loss_price, take_profit_price):
+    def _bind_loop(self):
         """
-        Monitor the position and sell when stop loss or take profit is hit.
+        Bind the bot to the running event loop and start the trade_updates
+        stream, once. Called by run() and execute_trade_cycle().
+        """
+        if self._open_lock is None:
+            self._loop = asyncio.get_running_loop()
+            self._open_lock = asyncio.Lock()
+            self._start_trade_updates()
+    
+    def _start_trade_updates(self):
+        """
+        Start the trade_updates stream in a background thread, once.
+        """
+        if self._stream_thread is None:
+            self.stream.subscribe_trade_updates(self._on_trade_update)
+            self._stream_thread = threading.Thread(target=self.stream.run, daemon=True)
+            self._stream_thread.start()
+    
+    def get_filled_exit_leg(self, order_id):
         """
-        logger.info(f"Monitoring position: {symbol}")
-        logger.info(f"Entry: ${entry_price:.2f}, Stop Loss: ${stop_loss_price:.2f}, Take Profit: ${take_profit_price:.2f}")
+        Check a bracket order over REST.
+        Returns the raw order dict of its filled exit leg, the raw dict of the
+        buy order itself if it ended without filling, or None if the position
+        is still open. Raw dicts match what the trade_updates stream delivers.
+        """
+        order = self.api.get_order(order_id, nested=True)
+        if order.status in _UNFILLED_EVENTS and not float(order.filled_qty or 0):
+            return order._raw
+        for leg in order.legs or []:
+            if leg.status == 'filled':
+                return leg._raw
+        return None
+    
+    def get_check_delay(self, current_price, stop_loss_price, take_profit_price):
+        """
+        Seconds to wait before the next REST order check. Exits are triggered
+        by the broker and reported over the stream, so this check only catches
+        missed fills: it runs every CHECK_INTERVAL within 5% of an exit level
+        and backs off linearly with the distance beyond that, up to
+        10 * CHECK_INTERVAL.
+        """
+        if current_price is None:
+            return self.config.CHECK_INTERVAL
         
-        while True:
-            try:
-                current_price = self.get_current_price(symbol)
-                
-                if current_price is None:
-                    time.sleep(self.config.CHECK_INTERVAL)
-                    continue
-                
-                # Check stop loss
-                if current_price <= stop_loss_price:
-                    logger.warning(f"Stop loss triggered at ${current_price:.2f}")
-                    self.place_sell_order(symbol, quantity)
-                    loss = (current_price - entry_price) * quantity
-                    return loss, 'stop_loss'
-                
-                # Check take profit
-                elif current_price >= take_profit_price:
-                    logger.info(f"Take profit triggered at ${current_price:.2f}")
-                    self.place_sell_order(symbol, quantity)
-                    profit = (current_price - entry_price) * quantity
-                    return profit, 'take_profit'
+        distance = min(current_price - stop_loss_price, take_profit_price - current_price) / current_price
+        return self.config.CHECK_INTERVAL * min(10, max(1, distance * 20))
+    
+    async def monitor_position(self, symbol, order_id, entry_price, quantity, stop_loss_price, take_profit_price):
+        """
+        Wait for the stop loss or take profit leg of the bracket order to fill.
+        The position must already be registered in _exit_waiters by open_position().
+        Returns (result, exit_type), or (None, status) if the buy order was
+        canceled, rejected or expired without filling.
+        """
+        logger.info("Monitoring position: %s", symbol)
+        logger.info("Entry: $%.2f, Stop Loss: $%.2f, Take Profit: $%.2f", entry_price, stop_loss_price, take_profit_price)
+        
+        waiter = self._exit_waiters[symbol]
+        
+        # Fills arrive over the stream; the order is also checked over REST
+        # in case a fill was missed (e.g. while reconnecting). Checks back off
+        # while the price is far from both exit levels.
+        delay = self.config.CHECK_INTERVAL
+        closed = threading.Event()
+        try:
+            # Stream trades so price checks below are a dict lookup instead of
+            # a REST request, without delaying the fill wait
+            threading.Thread(target=self._stream_trades, args=(symbol, closed), daemon=True).start()
+            
+            while True:
+                try:
+                    exit_order = await asyncio.wait_for(asyncio.shield(waiter), delay)
+                    break
+                except asyncio.TimeoutError:
+                    pass
                 
-                time.sleep(self.config.CHECK_INTERVAL)
+                try:
+                    exit_order = await asyncio.to_thread(self.get_filled_exit_leg, order_id)
+                except Exception as e:
+                    logger.error("Error monitoring position: %s", e)
+                else:
+                    if exit_order is not None:
+                        break
                 
-            except Exception as e:
-                logger.error(f"Error monitoring position: {e}")
-                time.sleep(self.config.CHECK_INTERVAL)
+                current_price = await asyncio.to_thread(self.get_current_price, symbol)
+                delay = self.get_check_delay(current_price, stop_loss_price, take_profit_price)
+        finally:
+            del self._exit_waiters[symbol]
+            closed.set()
+        
+        if exit_order['side'] == 'buy':
+            logger.warning("Buy order for %s was %s without filling", symbol, exit_order['status'])
+            return None, exit_order['status']
+        
+        exit_price = float(exit_order['filled_avg_price'])
+        result = (exit_price - entry_price) * quantity
+        
+        # The take profit leg is a limit order, the stop loss leg a stop order
+        if exit_order['type'] == 'limit':
+            logger.info("Take profit triggered at $%.2f", exit_price)
+            return result, 'take_profit'
+        logger.warning("Stop loss triggered at $%.2f", exit_price)
+        return result, 'stop_loss'
     
-    def execute_trade_cycle(self):
+    async def open_position(self):
         """
-        Execute one complete trade cycle.
+        Select a stock that is not already held and buy it with a bracket order.
+        Returns (symbol, order_id, entry_price, quantity, stop_loss_price,
+        take_profit_price), or None if no position could be opened.
         """
-        logger.info(f"\n{'='*50}")
-        logger.info(f"Starting trade cycle #{self.trades_completed + 1}")
-        logger.info(f"Current pot: ${self.pot:.2f}")
-        logger.info(f"Total profit so far: ${self.total_profit:.2f}")
-        logger.info(f"{'='*50}\n")
+        logger.info("\n" + "="*50)
+        logger.info("Starting trade cycle #%d", self.trades_completed + 1)
+        logger.info("Current pot: $%.2f", self.pot)
+        logger.info("Total profit so far: $%.2f", self.total_profit)
+        logger.info("="*50 + "\n")
         
         # Find most traded stock
-        symbol = self.get_most_traded_stock()
+        symbol = await asyncio.to_thread(self.get_most_traded_stock, set(self._exit_waiters))
         if not symbol:
             logger.error("Could not find suitable stock to trade")
-            return False
+            return None
         
         # Get current price
-        entry_price = self.get_current_price(symbol)
+        entry_price = await asyncio.to_thread(self.get_current_price, symbol)
         if not entry_price:
-            logger.error(f"Could not get price for {symbol}")
-            return False
+            logger.error("Could not get price for %s", symbol)
+            return None
+        
+        # Split the uncommitted part of the pot across the free position slots
+        free_slots = self.config.MAX_OPEN_POSITIONS - self._open_positions
+        allocation = (self.pot - self._committed) / free_slots
         
         # Calculate quantity to buy
-        quantity = int(self.pot / entry_price)
+        quantity = int(allocation / entry_price)
         if quantity == 0:
-            logger.error(f"Insufficient funds to buy {symbol} at ${entry_price:.2f}")
-            return False
+            logger.error("Insufficient funds to buy %s at $%.2f", symbol, entry_price)
+            return None
         
         # Calculate stop loss and take profit prices
-        stop_loss_price = entry_price * (1 - self.config.STOP_LOSS_PCT)
-        take_profit_price = entry_price * (1 + self.config.TAKE_PROFIT_PCT)
+        stop_loss_price = entry_price * self.config.STOP_MULT
+        take_profit_price = entry_price * self.config.TP_MULT
         
-        logger.info(f"Trading {symbol}:")
-        logger.info(f"  Quantity: {quantity}")
-        logger.info(f"  Entry price: ${entry_price:.2f}")
-        logger.info(f"  Stop loss: ${stop_loss_price:.2f} (-{self.config.STOP_LOSS_PCT*100}%)")
-        logger.info(f"  Take profit: ${take_profit_price:.2f} (+{self.config.TAKE_PROFIT_PCT*100}%)")
+        logger.info("Trading %s:", symbol)
+        logger.info("  Quantity: %s", quantity)
+        logger.info("  Entry price: $%.2f", entry_price)
+        logger.info("  Stop loss: $%.2f (-%s%%)", stop_loss_price, self.config.STOP_LOSS_PCT*100)
+        logger.info("  Take profit: $%.2f (+%s%%)", take_profit_price, self.config.TAKE_PROFIT_PCT*100)
         
         # Place buy order
-        buy_order = self.place_buy_order(symbol, quantity)
+        buy_order = await asyncio.to_thread(
+            self.place_buy_order, symbol, quantity, stop_loss_price, take_profit_price
+        )
         if not buy_order:
-            return False
+            return None
         
-        # Wait for order to fill
-        time.sleep(5)
+        # Register the position so fills are routed to it and later cycles skip it
+        self._exit_waiters[symbol] = self._loop.create_future()
+        
+        return symbol, buy_order.id, entry_price, quantity, stop_loss_price, take_profit_price
+    
+    async def execute_trade_cycle(self):
+        """
+        Execute one complete trade cycle.
+        """
+        self._bind_loop()
+        async with self._open_lock:
+            position = await self.open_position()
+            if position is None:
+                return False
+            
+            # Reserve the slot and capital before the next cycle sizes its position
+            _, _, entry_price, quantity, _, _ = position
+            cost = entry_price * quantity
+            self._open_positions += 1
+            self._committed += cost
         
         # Monitor position
-        result, exit_type = self.monitor_position(
-            symbol, entry_price, quantity, stop_loss_price, take_profit_price
-        )
+        try:
+            result, exit_type = await self.monitor_position(*position)
+        finally:
+            self._open_positions -= 1
+            self._committed -= cost
+        
+        if result is None:
+            return False
         
         # Update pot and profit
         self.pot += result
         self.total_profit += result
         self.trades_completed += 1
         
-        logger.info(f"\nTrade completed via {exit_type}")
-        logger.info(f"Result: ${result:.2f}")
-        logger.info(f"New pot: ${self.pot:.2f}")
-        logger.info(f"Total profit: ${self.total_profit:.2f}")
+        logger.info("\nTrade completed via %s", exit_type)
+        logger.info("Result: $%.2f", result)
+        logger.info("New pot: $%.2f", self.pot)
+        logger.info("Total profit: $%.2f", self.total_profit)
         
         return True
     
-    def run(self):
+    async def _trade_slot(self):
+        """
+        Run one trade cycle, then wait before the slot is reused.
+        """
+        try:
+            success = await self.execute_trade_cycle()
+        except Exception as e:
+            logger.error("Unexpected error: %s", e)
+            success = False
+        
+        if not success:
+            logger.warning("Trade cycle failed, waiting before retry...")
+            await asyncio.sleep(60)
+        elif self.total_profit < self.config.PROFIT_TARGET:
+            # Wait before next trade
+            await asyncio.sleep(self.config.TRADE_INTERVAL)
+    
+    async def run(self):
         """
         Main bot loop - runs until profit target is reached.
+        Up to MAX_OPEN_POSITIONS trade cycles run concurrently.
         """
-        logger.info("\n" + "="*60)
-        logger.info("TRADING BOT STARTED")
-        logger.info(f"Initial Pot: ${self.pot:.2f}")
-        logger.info(f"Profit Target: ${self.config.PROFIT_TARGET:.2f}")
-        logger.info(f"Stop Loss: {self.config.STOP_LOSS_PCT*100}%")
-        logger.info(f"Take Profit: {self.config.TAKE_PROFIT_PCT*100}%")
-        logger.info("="*60 + "\n")
-        
-        while self.total_profit < self.config.PROFIT_TARGET:
-            try:
-                success = self.execute_trade_cycle()
-                
-                if not success:
-                    logger.warning("Trade cycle failed, waiting before retry...")
-                    time.sleep(60)
-                    continue
-                
-                # Check if target reached
-                if self.total_profit >= self.config.PROFIT_TARGET:
-                    logger.info("\n" + "="*60)
-                    logger.info("🎉 PROFIT TARGET REACHED! 🎉")
-                    logger.info(f"Total profit: ${self.total_profit:.2f}")
-                    logger.info(f"Final pot: ${self.pot:.2f}")
-                    logger.info(f"Trades completed: {self.trades_completed}")
-                    logger.info("="*60 + "\n")
-                    break
-                
-                # Wait before next trade
-                time.sleep(self.config.TRADE_INTERVAL)
-                
-            except KeyboardInterrupt:
-                logger.info("\nBot stopped by user")
-                break
-            except Exception as e:
-                logger.error(f"Unexpected error: {e}")
-                time.sleep(60)
+        logger.info(self._START_BANNER.format_map({'bot': self, 'config': self.config}))
+        
+        self._bind_loop()
+        
+        slots = set()
+        try:
+            while self.total_profit < self.config.PROFIT_TARGET:
+                while len(slots) < self.config.MAX_OPEN_POSITIONS:
+                    slots.add(asyncio.create_task(self._trade_slot()))
+                _, slots = await asyncio.wait(slots, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Positions still open keep their bracket legs at the broker
+            for slot in slots:
+                slot.cancel()
+        
+        logger.info(self._TARGET_BANNER.format_map({'bot': self, 'config': self.config}))
+
+def _resolve(future, result):
+    """
+    Set a future's result unless it is already done.
+    """
+    if not future.done():
+        future.set_result(result)
 
 if __name__ == "__main__":
     # Load configuration
-    config = Config()
+    config = get_config()
     
     # Create and run bot
     bot = TradingBot(config)
-    bot.run()
+    try:
+        asyncio.run(bot.run())
+    except KeyboardInterrupt:
+        logger.info("\nBot stopped by user")